@@ -3,30 +3,99 @@ PowerPoint generator for DOE analysis reports.
 Creates professional .pptx presentations with analysis results, visualizations, and tables.
 """
 import re
+import sys
+import copy
+import contextvars
+import threading
 import json
+import logging
+import mmap
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from io import BytesIO
+from io import BytesIO, StringIO
+from types import SimpleNamespace
 import base64
-import pandas as pd
-import numpy as np
-from bs4 import BeautifulSoup
-import plotly.graph_objects as go
-from plotly.io import to_image
+import binascii
 
-try:
-    import pdfplumber
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
+logger = logging.getLogger(__name__)
+
+# Heavy dependencies (pandas, plotly, bs4, pdfplumber, python-pptx) are imported
+# at first use so that importing this module stays cheap.
+PDFPLUMBER_AVAILABLE = importlib.util.find_spec("pdfplumber") is not None
+PPTX_AVAILABLE = importlib.util.find_spec("pptx") is not None
+
+# Rendered plots are placed 8 inches wide on the slide; at 96 DPI that is
+# 768 px, so rendering any larger only bloats the .pptx.
+PLOT_IMAGE_WIDTH_PX = 768
+PLOT_IMAGE_HEIGHT_PX = 512
+
+# The full and reduced model decks add at most this many leverage plot slides
+MAX_LEVERAGE_SLIDES = 51
+
+# Used to pull the data/layout JSON out of Plotly.newPlot(...) calls in place
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WS_RE = re.compile(r'\s*')
+_JSON_SEP_RE = re.compile(r'\s*,\s*')
 
-try:
+# Bytes pattern so it can run directly over a memory-mapped report
+_INTERACTION_SECTION_RE = re.compile(
+    rb'<h2>Interaction Plot[s]*.*?</h2>(.*?)(?=<h2>|</body>)',
+    re.DOTALL | re.IGNORECASE
+)
+# Cheap literal pre-check; case-insensitive like the section pattern above
+_INTERACTION_HEADING_RE = re.compile(rb'Interaction Plot', re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _pptx():
+    """
+    Import python-pptx on first use and return the names used by this module.
+    
+    Inches, Pt and RGBColor produce immutable values and are called with the
+    same handful of constants on every slide, so they are memoized.
+    
+    Returns:
+        SimpleNamespace: Presentation, Inches, Pt, PP_ALIGN, MSO_ANCHOR, RGBColor
+    """
     from pptx import Presentation
     from pptx.util import Inches, Pt
     from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
     from pptx.dml.color import RGBColor
-    PPTX_AVAILABLE = True
-except ImportError:
-    PPTX_AVAILABLE = False
+    return SimpleNamespace(
+        Presentation=Presentation,
+        Inches=lru_cache(maxsize=128)(Inches),
+        Pt=lru_cache(maxsize=128)(Pt),
+        PP_ALIGN=PP_ALIGN,
+        MSO_ANCHOR=MSO_ANCHOR,
+        RGBColor=lru_cache(maxsize=128)(RGBColor),
+    )
+
+
+def _optimize_png(png_bytes):
+    """
+    Re-encode PNG bytes with maximum lossless compression.
+    
+    Args:
+        png_bytes (bytes): PNG image data
+        
+    Returns:
+        BytesIO: Optimized PNG, or the original bytes if re-encoding fails
+    """
+    from PIL import Image
+    
+    try:
+        with Image.open(BytesIO(png_bytes)) as im:
+            buf = BytesIO()
+            im.save(buf, format='PNG', optimize=True, compress_level=9)
+        if buf.tell() < len(png_bytes):
+            buf.seek(0)
+            return buf
+    except Exception as e:
+        logger.warning("Could not optimize PNG: %s", e)
+    return BytesIO(png_bytes)
 
 
 def extract_model_fit_plot_from_pdf(html_path):
@@ -43,6 +112,8 @@ def extract_model_fit_plot_from_pdf(html_path):
         print("  ! pdfplumber not available")
         return None
     
+    import pdfplumber
+    
     try:
         # Determine PDF path from HTML path
         # HTML: outputs/doe_analysis_report.html -> PDF: outputs/doe_analysis_report_summary.pdf
@@ -74,10 +145,6 @@ def extract_model_fit_plot_from_pdf(html_path):
             # Get the first image (model fit diagram)
             img_info = page.images[0]
             
-            # Use convert_to_images to get PIL image and save as PNG
-            # This properly handles PDF image decompression
-            from PIL import Image
-            
             # Extract raw image data using pdfplumber's method
             try:
                 # Get cropped image from page
@@ -96,84 +163,63 @@ def extract_model_fit_plot_from_pdf(html_path):
                 print("  ! Could not extract using crop method, trying stream extraction")
                 return None
             
-    except Exception as e:
-        print(f"  ! Error extracting from PDF: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error extracting from PDF")
         return None
 
 
+def extract_model_diagram_image(html_path):
     """
-    Generate the Actual by Predicted plot from HTML data and render as image.
-    Recreates the same plot as shown in the PDF reports.
+    Extract the Actual by Predicted plot from PDF file.
     
     Args:
         html_path (str): Path to HTML file
         
     Returns:
-        BytesIO: Image BytesIO object or None if generation fails
+        BytesIO: Image BytesIO object or None if extraction fails
     """
-    try:
-        # Extract tables from HTML to get model results
-        tables = extract_html_tables(html_path)
-        
-        if not tables or len(tables) < 2:
-            print("  ! Could not find sufficient data in HTML")
-            return None
-        
-        # Get actual and predicted values from the HTML
-        # We'll look for patterns in the HTML that indicate actual vs predicted
-        with open(html_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        # Try to extract from the first Plotly figure in the HTML
-        # Look for the trace data with actual and predicted points
-        pattern = r'Plotly\.newPlot\([^,]*,\s*(\[.*?\]),\s*(\{.*?\}),\s*(\{.*?\})\s*\)'
-        match = re.search(pattern, html_content, re.DOTALL)
-        
-        if not match:
-            print("  ! Could not find Plotly figure in HTML")
-            return None
-        
-        try:
-            # Extract the data and layout from the match
-            data_str = match.group(1)
-            layout_str = match.group(2)
-            
-            # Parse JSON strings carefully
-            data = json.loads(data_str)
-            layout = json.loads(layout_str)
-            
-            # Create Plotly figure with the extracted data
-            fig = go.Figure(data=data, layout=layout)
-            
-            # Render to image with good resolution
-            image_bytes = to_image(fig, format='png', width=900, height=700)
-            image_io = BytesIO(image_bytes)
-            return image_io
-            
-        except Exception as e:
-            print(f"  ! Error parsing Plotly figure data: {e}")
-            return None
-            
-    except Exception as e:
-        print(f"  ! Error generating model fit plot: {e}")
-        return None
+    return extract_model_fit_plot_from_pdf(html_path)
 
 
-def extract_model_diagram_image(html_path):
+@lru_cache(maxsize=4)
+def _read_report_text_cached(path, mtime_ns):
+    """Read a report from disk; mtime_ns is part of the cache key only."""
+    return Path(path).read_text(encoding='utf-8')
+
+
+def _report_key(html_path):
     """
-    Extract the Actual by Predicted plot from PDF file.
+    Build the cache key identifying one version of a report file.
     
     Args:
         html_path (str): Path to HTML file
         
     Returns:
-        BytesIO: Image BytesIO object or None if extraction fails
+        tuple: (resolved path, modification time in ns)
     """
-    return extract_model_fit_plot_from_pdf(html_path)
+    path = Path(html_path).resolve()
+    return str(path), path.stat().st_mtime_ns
 
 
+def _read_report_text(html_path):
+    """
+    Return the decoded text of an HTML report, read from disk once per file version.
+    
+    Each report is consumed by several extractors (images, tables) and by more
+    than one PowerPoint builder, so the text is cached keyed on path and mtime.
+    The extractors run concurrently; the per-report lock makes all but the first
+    wait for its read instead of reading and decoding the file again.
+    
+    Args:
+        html_path (str): Path to HTML file
+        
+    Returns:
+        str: HTML content
+    """
+    key = _report_key(html_path)
+    with _report_lock(key[0], 'text'):
+        return _read_report_text_cached(*key)
+
 
 def extract_base64_images_from_html(html_path, max_images=10, skip_first=True):
     """
@@ -187,11 +233,13 @@ def extract_base64_images_from_html(html_path, max_images=10, skip_first=True):
     Returns:
         list: List of image BytesIO objects
     """
+    from bs4 import BeautifulSoup, SoupStrainer
+    
     try:
-        with open(html_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        html_content = _read_report_text(html_path)
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # lxml is much faster than html.parser, and only <img> tags are needed
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=SoupStrainer('img'))
         images = []
         
         # Find all img tags with base64 data
@@ -213,7 +261,7 @@ def extract_base64_images_from_html(html_path, max_images=10, skip_first=True):
                     images.append(image_io)
                     img_count += 1
                 except Exception as e:
-                    print(f"Warning: Could not extract image {idx}: {e}")
+                    logger.warning("Could not extract image %d: %s", idx, e)
         
         return images
     except Exception as e:
@@ -231,14 +279,104 @@ def extract_html_tables(html_path):
     Returns:
         list: List of pandas DataFrames extracted from tables
     """
+    import pandas as pd
+    
     try:
-        tables = pd.read_html(html_path)
+        # Pin the lxml parser so pandas never falls back to bs4 + html5lib
+        tables = pd.read_html(StringIO(_read_report_text(html_path)), flavor='lxml')
         return tables
     except Exception as e:
         print(f"Error extracting tables from HTML: {e}")
         return []
 
 
+TABLE_KINDS = ('comparison', 'anova', 'lof', 'params')
+
+
+def _table_contains(tbl, text):
+    """
+    Check whether any text cell of a table contains the given substring.
+    
+    Only object (string) columns are scanned; numeric columns cannot match.
+    
+    Args:
+        tbl (pd.DataFrame): Table to search
+        text (str): Substring to look for
+        
+    Returns:
+        bool: True if any cell contains text
+    """
+    for col in tbl.select_dtypes(include='object').columns:
+        if tbl[col].astype(str).str.contains(text, regex=False).any():
+            return True
+    return False
+
+
+def classify_tables(tables):
+    """
+    Classify report tables by kind in a single pass.
+    
+    A table may match several kinds; for each kind the first matching table wins,
+    and the scan stops as soon as every kind in TABLE_KINDS has been found.
+    Kinds: 'comparison' (Full vs Reduced), 'anova', 'lof' (Lack of Fit), 'params'.
+    
+    Args:
+        tables (list): List of pandas DataFrames from extract_html_tables
+        
+    Returns:
+        dict: Mapping of kind to the first matching DataFrame
+    """
+    classified = {}
+    for tbl in tables:
+        # Every kind has been found; later tables cannot change the result
+        if len(classified) == len(TABLE_KINDS):
+            break
+        
+        col_set = {str(c).lower() for c in tbl.columns}
+        cols_str = ' '.join(col_set)
+        # ANOVA table: has an 'F' column plus 'df' or 'sum_sq'
+        anova_like = (({'df', 'f'} <= col_set or {'sum_sq', 'f'} <= col_set)
+                      and len(tbl) > 2 and 'anova' not in classified)
+        # Only scan cell contents when the answer can still matter
+        is_lof = ((anova_like or 'lof' not in classified)
+                  and _table_contains(tbl, 'Lack of Fit'))
+        
+        if 'Full Model' in tbl.columns and 'Reduced Model' in tbl.columns:
+            classified.setdefault('comparison', tbl)
+        # The LOF table has ANOVA-like columns too; exclude it
+        if anova_like and not is_lof:
+            classified['anova'] = tbl
+        if is_lof:
+            classified.setdefault('lof', tbl)
+        # Parameters table has a Coefficient or coef column
+        if 'coefficient' in cols_str or 'coef' in cols_str or 'estimate' in cols_str:
+            classified.setdefault('params', tbl)
+    return classified
+
+
+def top_parameters_by_pvalue(param_df, n=25):
+    """
+    Select the n parameters with the lowest p-values, sorted low to high.
+    
+    Uses nsmallest (partial selection) rather than sorting every row. Falls
+    back to a full sort when the p-value column is not numeric, and to the
+    first n rows when there is no p-value column at all.
+    
+    Args:
+        param_df (DataFrame): Parameter table from classify_tables
+        n (int): Number of rows to keep
+        
+    Returns:
+        DataFrame: At most n rows of param_df
+    """
+    for col in ('p-value', 'P>|t|'):
+        if col in param_df.columns:
+            if param_df[col].dtype.kind in 'iuf':
+                return param_df.nsmallest(n, col)
+            return param_df.sort_values(col).head(n)
+    return param_df.head(n)
+
+
 def extract_interaction_plots_from_html(html_path):
     """
     Extract Plotly interaction plots from HTML file as PNG images.
@@ -251,24 +389,29 @@ def extract_interaction_plots_from_html(html_path):
     Returns:
         list: List of (plot_name, image_io) tuples for interaction plots
     """
+    from plotly.io import to_image
+    
     try:
-        with open(html_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
         interaction_plots = []
         
-        # Find the Interaction Plots section
-        match = re.search(
-            r'<h2>Interaction Plot[s]*.*?</h2>(.*?)(?=<h2>|</body>)',
-            html_content,
-            re.DOTALL | re.IGNORECASE
-        )
-        
-        if not match:
-            print("  ! No interaction plots section found in HTML")
-            return []
-        
-        interaction_section = match.group(1)
+        # Find the Interaction Plots section on a memory-mapped view of the file
+        # and decode only that section (it holds both the divs and their
+        # Plotly.newPlot scripts) instead of reading the whole report into a str
+        with open(html_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Literal scan first so reports without the section skip the
+            # DOTALL regex entirely
+            if _INTERACTION_HEADING_RE.search(mm) is None:
+                print("  ! No interaction plots section found in HTML")
+                return []
+            
+            match = _INTERACTION_SECTION_RE.search(mm)
+            
+            if not match:
+                print("  ! No interaction plots section found in HTML")
+                return []
+            
+            interaction_section = match.group(1).decode('utf-8')
         
         # Extract Plotly div IDs - look for id attribute in divs with plotly-graph-div class
         # Pattern: <div id="UUID" class="plotly-graph-div" ...></div>
@@ -281,73 +424,42 @@ def extract_interaction_plots_from_html(html_path):
         
         print(f"  Found {len(div_matches)} interaction plot div(s)")
         
-        # Extract plot data from the Plotly initialization scripts
+        # Extract plot data from the Plotly initialization scripts; with no
+        # Plotly.newPlot call at all, skip the per-div searches and go straight
+        # to the image fallback
         plot_counter = 0
-        for div_id in div_matches:
+        plot_divs = div_matches if 'Plotly.newPlot' in interaction_section else []
+        for div_id in plot_divs:
             try:
                 # Find the Plotly.newPlot call for this specific div
                 # Pattern: Plotly.newPlot(...div_id..., [...], {...}, ...)
                 # Use flexible whitespace pattern since HTML has extra spaces
                 pattern = rf'Plotly\.newPlot\s*\(\s*["\']?{re.escape(div_id)}["\']?\s*,'
-                pattern_match = re.search(pattern, html_content, re.DOTALL)
+                pattern_match = re.search(pattern, interaction_section, re.DOTALL)
                 
                 if not pattern_match:
-                    print(f"    ! Could not find plot call for div: {div_id}")
+                    logger.warning("Could not find plot call for div: %s", div_id)
                     continue
                 
-                pattern_start = pattern_match.start()
-                
-                # Find data array [...]
-                # Start searching after the comma following the div ID
-                extract_start = pattern_match.end()
-                bracket_pos = html_content.find('[', extract_start)
-                if bracket_pos == -1 or bracket_pos > extract_start + 100:
+                # Decode the data array [...] and layout object {...} that follow
+                # the div ID; raw_decode returns each value and the index after it
+                data_start = _JSON_WS_RE.match(interaction_section, pattern_match.end()).end()
+                if not interaction_section.startswith('[', data_start):
                     continue
+                data, data_end = _JSON_DECODER.raw_decode(interaction_section, data_start)
                 
-                # Count nested brackets to find end of data array
-                bracket_count = 0
-                data_end = bracket_pos
-                for i in range(bracket_pos, len(html_content)):
-                    if html_content[i] == '[':
-                        bracket_count += 1
-                    elif html_content[i] == ']':
-                        bracket_count -= 1
-                        if bracket_count == 0:
-                            data_end = i + 1
-                            break
-                
-                data_str = html_content[bracket_pos:data_end]
-                
-                # Find layout object {...}
-                # Start searching after data array
-                brace_pos = html_content.find('{', data_end)
-                if brace_pos == -1 or brace_pos > data_end + 100:
+                layout_start = _JSON_SEP_RE.match(interaction_section, data_end).end()
+                if not interaction_section.startswith('{', layout_start):
                     continue
+                layout, _ = _JSON_DECODER.raw_decode(interaction_section, layout_start)
                 
-                # Count nested braces to find end of layout object
-                brace_count = 0
-                layout_end = brace_pos
-                for i in range(brace_pos, len(html_content)):
-                    if html_content[i] == '{':
-                        brace_count += 1
-                    elif html_content[i] == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            layout_end = i + 1
-                            break
-                
-                layout_str = html_content[brace_pos:layout_end]
-                
-                # Parse JSON
-                data = json.loads(data_str)
-                layout = json.loads(layout_str)
-                
-                # Create Plotly figure
-                fig = go.Figure(data=data, layout=layout)
-                
-                # Render to PNG
-                img_bytes = to_image(fig, format='png', width=900, height=600)
-                image_io = BytesIO(img_bytes)
+                # Render to PNG at the size the slide actually displays. The JSON
+                # was written by Plotly itself, so pass it through as a plain dict
+                # without building and validating a go.Figure
+                fig_dict = {'data': data, 'layout': layout}
+                img_bytes = to_image(fig_dict, format='png', validate=False,
+                                     width=PLOT_IMAGE_WIDTH_PX, height=PLOT_IMAGE_HEIGHT_PX)
+                image_io = _optimize_png(img_bytes)
                 
                 plot_title = layout.get('title', {})
                 if isinstance(plot_title, dict):
@@ -357,39 +469,247 @@ def extract_interaction_plots_from_html(html_path):
                 
                 interaction_plots.append((plot_title, image_io))
                 plot_counter += 1
-                print(f"    ✓ Rendered: {plot_title}")
+                logger.debug("Rendered: %s", plot_title)
                 
             except Exception as e:
-                print(f"    ! Could not parse plot data for div {div_id}: {str(e)[:100]}")
-                import traceback
-                traceback.print_exc()
+                logger.warning("Could not parse plot data for div %s: %.100s", div_id, e)
+                logger.debug("Plot data parse failure for div %s", div_id, exc_info=True)
                 continue
         
         if not interaction_plots:
             # Try alternative extraction method - look for base64 images in div elements
             print("  Trying alternative extraction method...")
-            img_pattern = r'<img[^>]*src="(data:image/png;base64,[^"]+)"'
-            img_matches = re.findall(img_pattern, interaction_section)
+            # Capture only the base64 payload so no per-match split is needed
+            img_pattern = r'<img[^>]*src="data:image/png;base64,([^"]+)"'
+            img_payloads = re.findall(img_pattern, interaction_section)
             
-            for idx, img_src in enumerate(img_matches):
+            for idx, payload in enumerate(img_payloads):
                 try:
-                    base64_data = img_src.split(',')[1]
-                    image_bytes = base64.b64decode(base64_data)
-                    image_io = BytesIO(image_bytes)
+                    image_io = BytesIO(binascii.a2b_base64(payload))
                     interaction_plots.append((f'Interaction Plot {idx + 1}', image_io))
-                    print(f"    ✓ Extracted image {idx + 1}")
-                except Exception as e:
-                    print(f"    ! Could not extract image {idx}: {e}")
+                    logger.debug("Extracted image %d", idx + 1)
+                except (binascii.Error, ValueError) as e:
+                    logger.warning("Could not extract image %d: %s", idx, e)
         
         return interaction_plots
         
     except Exception as e:
         print(f"  Error extracting interaction plots: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("Interaction plot extraction failed", exc_info=True)
         return []
 
 
+@lru_cache(maxsize=4)
+def _cached_report_images(path, mtime_ns):
+    """
+    Cached backend for load_report_images; mtime_ns is part of the key only.
+    
+    Returns the report's mutable cache entry, which load_report_images fills:
+    'images' holds the decoded images up to the largest limit asked for so far,
+    and 'complete' is set once the report has no further images.
+    """
+    return SimpleNamespace(images=(), complete=False)
+
+
+@lru_cache(maxsize=4)
+def _cached_report_tables(path, mtime_ns):
+    """Cached backend for load_report_tables; mtime_ns is part of the key only."""
+    return tuple(extract_html_tables(path))
+
+
+@lru_cache(maxsize=4)
+def _cached_report_interaction_plots(path, mtime_ns):
+    """Cached backend for load_report_interaction_plots; mtime_ns is part of the key only."""
+    plots = extract_interaction_plots_from_html(path)
+    return tuple((plot_title, image_io.getvalue()) for plot_title, image_io in plots)
+
+
+_REPORT_LOCKS = {}
+_REPORT_LOCKS_GUARD = threading.Lock()
+
+
+def _report_lock(path, kind):
+    """
+    Return the lock serializing one kind of extraction for one report file.
+    
+    Builders run in parallel threads; holding this lock while filling the
+    extraction caches makes a second thread wait for the first result instead
+    of parsing the same report again. Different reports, and different kinds
+    of content from the same report, do not block each other.
+    
+    Args:
+        path (str): Resolved report path
+        kind (str): Content kind ('text', 'images', 'tables' or 'interaction_plots')
+        
+    Returns:
+        threading.Lock: Lock for that path and kind
+    """
+    with _REPORT_LOCKS_GUARD:
+        return _REPORT_LOCKS.setdefault((path, kind), threading.Lock())
+
+
+def load_report_images(html_path, max_images=None):
+    """
+    Return the leverage plot images of a report (all images except the first).
+    
+    Only the first max_images images are decoded. One decode per report
+    version (path + mtime), at the largest limit asked for so far, is shared
+    by all PowerPoint builders and sliced per caller; a later call asking for
+    more images than cached decodes the report again at the new limit. The raw
+    bytes are cached and wrapped in fresh BytesIO objects on every call.
+    
+    Args:
+        html_path (str): Path to HTML file
+        max_images (int): Maximum number of images to return (None for up to 150)
+        
+    Returns:
+        list: List of image BytesIO objects
+    """
+    if max_images is None:
+        max_images = 150
+    key = _report_key(html_path)
+    with _report_lock(key[0], 'images'):
+        cached = _cached_report_images(*key)
+        if len(cached.images) < max_images and not cached.complete:
+            images = extract_base64_images_from_html(key[0], max_images=max_images, skip_first=True)
+            # Identical payloads share one bytes object so repeated plots are held once
+            unique = {}
+            deduped = []
+            for image_io in images:
+                image_bytes = image_io.getvalue()
+                deduped.append(unique.setdefault(image_bytes, image_bytes))
+            cached.images = tuple(deduped)
+            cached.complete = len(images) < max_images
+        images = cached.images[:max_images]
+    return [BytesIO(image_bytes) for image_bytes in images]
+
+
+def load_report_tables(html_path):
+    """
+    Return the tables of a report, extracted once per report version.
+    
+    The DataFrames are shared between callers and must not be modified in place.
+    
+    Args:
+        html_path (str): Path to HTML file
+        
+    Returns:
+        list: List of pandas DataFrames
+    """
+    key = _report_key(html_path)
+    with _report_lock(key[0], 'tables'):
+        return list(_cached_report_tables(*key))
+
+
+def load_report_interaction_plots(html_path):
+    """
+    Return the rendered interaction plots of a report, extracted once per report version.
+    
+    Args:
+        html_path (str): Path to HTML file
+        
+    Returns:
+        list: List of (plot_name, image_io) tuples
+    """
+    key = _report_key(html_path)
+    with _report_lock(key[0], 'interaction_plots'):
+        plots = _cached_report_interaction_plots(*key)
+    return [(plot_title, BytesIO(image_bytes)) for plot_title, image_bytes in plots]
+
+
+def clear_report_caches():
+    """
+    Drop every cached report text, image, table and interaction plot.
+    
+    The caches hold the decoded content of the last few reports for as long as
+    the process runs; call this once the presentations that share them are built.
+    """
+    _read_report_text_cached.cache_clear()
+    _cached_report_images.cache_clear()
+    _cached_report_tables.cache_clear()
+    _cached_report_interaction_plots.cache_clear()
+
+
+_report_cache_users = 0
+_REPORT_CACHE_USERS_GUARD = threading.Lock()
+
+
+@contextmanager
+def shared_report_caches():
+    """
+    Keep extracted report content cached while any caller is inside this block.
+    
+    Builders that run inside the same block, from any thread, share one
+    extraction per report; when the last block exits, clear_report_caches
+    releases it. Each PowerPoint builder enters its own block, so a builder
+    called on its own frees everything it extracted when it returns. Also
+    usable as a decorator.
+    """
+    global _report_cache_users
+    with _REPORT_CACHE_USERS_GUARD:
+        _report_cache_users += 1
+    try:
+        yield
+    finally:
+        with _REPORT_CACHE_USERS_GUARD:
+            _report_cache_users -= 1
+            if _report_cache_users == 0:
+                clear_report_caches()
+
+
+def load_report_content(html_path, max_images=None):
+    """
+    Extract everything a model presentation needs from one report, concurrently.
+    
+    The PDF render, image decode, table parse and interaction plot render are
+    independent and spend most of their time in native code (PyMuPDF, lxml,
+    base64, Kaleido), so they run in parallel threads and the extraction takes
+    as long as the slowest of them rather than their sum.
+    
+    Args:
+        html_path (str): Path to HTML report
+        max_images (int): Maximum number of leverage plot images (None for up to 150)
+        
+    Returns:
+        tuple: (model_diagram, images, tables, interaction_plots), as returned by
+            extract_model_fit_plot_from_pdf, load_report_images,
+            load_report_tables and load_report_interaction_plots
+    """
+    # Each job runs in a copy of the caller's context so its prints follow the
+    # caller's (see _BuildOutput)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        model_diagram = executor.submit(
+            contextvars.copy_context().run, extract_model_fit_plot_from_pdf, html_path)
+        images = executor.submit(
+            contextvars.copy_context().run, load_report_images, html_path, max_images)
+        tables = executor.submit(
+            contextvars.copy_context().run, load_report_tables, html_path)
+        interaction_plots = executor.submit(
+            contextvars.copy_context().run, load_report_interaction_plots, html_path)
+    return model_diagram.result(), images.result(), tables.result(), interaction_plots.result()
+
+
+def _is_dataframe(obj):
+    """Return True if obj is a pandas DataFrame, without importing pandas eagerly."""
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(obj, pd.DataFrame)
+
+
+def _set_cell_fill(cell, rgb):
+    """
+    Set a solid fill on a table cell by editing its <a:tcPr> element directly.
+    
+    Equivalent to cell.fill.solid(); cell.fill.fore_color.rgb = rgb, without
+    building the FillFormat/ColorFormat proxy objects for every cell.
+    
+    Args:
+        cell (_Cell): Table cell
+        rgb (RGBColor): Fill color
+    """
+    tcPr = cell._tc.get_or_add_tcPr()
+    tcPr.get_or_change_to_solidFill().get_or_change_to_srgbClr().val = str(rgb)
+
+
 def create_title_slide(prs, title, subtitle=""):
     """
     Create a title slide.
@@ -402,6 +722,7 @@ def create_title_slide(prs, title, subtitle=""):
     Returns:
         Slide: The created slide
     """
+    ppt = _pptx()
     slide_layout = prs.slide_layouts[6]  # Blank layout
     slide = prs.slides.add_slide(slide_layout)
     
@@ -409,33 +730,33 @@ def create_title_slide(prs, title, subtitle=""):
     background = slide.background
     fill = background.fill
     fill.solid()
-    fill.fore_color.rgb = RGBColor(31, 78, 121)  # Dark blue
+    fill.fore_color.rgb = ppt.RGBColor(31, 78, 121)  # Dark blue
     
     # Add title
     title_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(2), Inches(9), Inches(1.5)
+        ppt.Inches(0.5), ppt.Inches(2), ppt.Inches(9), ppt.Inches(1.5)
     )
     title_frame = title_box.text_frame
     title_frame.word_wrap = True
     title_p = title_frame.paragraphs[0]
     title_p.text = title
-    title_p.font.size = Pt(54)
+    title_p.font.size = ppt.Pt(54)
     title_p.font.bold = True
-    title_p.font.color.rgb = RGBColor(255, 255, 255)
-    title_p.alignment = PP_ALIGN.CENTER
+    title_p.font.color.rgb = ppt.RGBColor(255, 255, 255)
+    title_p.alignment = ppt.PP_ALIGN.CENTER
     
     # Add subtitle
     if subtitle:
         subtitle_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(3.8), Inches(9), Inches(1)
+            ppt.Inches(0.5), ppt.Inches(3.8), ppt.Inches(9), ppt.Inches(1)
         )
         subtitle_frame = subtitle_box.text_frame
         subtitle_frame.word_wrap = True
         subtitle_p = subtitle_frame.paragraphs[0]
         subtitle_p.text = subtitle
-        subtitle_p.font.size = Pt(28)
-        subtitle_p.font.color.rgb = RGBColor(200, 200, 200)
-        subtitle_p.alignment = PP_ALIGN.CENTER
+        subtitle_p.font.size = ppt.Pt(28)
+        subtitle_p.font.color.rgb = ppt.RGBColor(200, 200, 200)
+        subtitle_p.alignment = ppt.PP_ALIGN.CENTER
     
     return slide
 
@@ -451,41 +772,42 @@ def create_equation_slide(prs, model_type="Full"):
     Returns:
         Slide: The created slide
     """
+    ppt = _pptx()
     slide_layout = prs.slide_layouts[6]  # Blank layout
     slide = prs.slides.add_slide(slide_layout)
     
     # Add title
     title_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(0.4), Inches(9), Inches(0.6)
+        ppt.Inches(0.5), ppt.Inches(0.4), ppt.Inches(9), ppt.Inches(0.6)
     )
     title_frame = title_box.text_frame
     title_p = title_frame.paragraphs[0]
     title_p.text = "Model Equation"
-    title_p.font.size = Pt(40)
+    title_p.font.size = ppt.Pt(40)
     title_p.font.bold = True
-    title_p.font.color.rgb = RGBColor(31, 78, 121)
+    title_p.font.color.rgb = ppt.RGBColor(31, 78, 121)
     
     # Add horizontal line
-    line = slide.shapes.add_connector(1, Inches(0.5), Inches(1.1), Inches(9.5), Inches(1.1))
-    line.line.color.rgb = RGBColor(31, 78, 121)
-    line.line.width = Pt(2)
+    line = slide.shapes.add_connector(1, ppt.Inches(0.5), ppt.Inches(1.1), ppt.Inches(9.5), ppt.Inches(1.1))
+    line.line.color.rgb = ppt.RGBColor(31, 78, 121)
+    line.line.width = ppt.Pt(2)
     
     # Main equation box with larger font
     eq_box = slide.shapes.add_textbox(
-        Inches(0.7), Inches(1.5), Inches(8.6), Inches(1.5)
+        ppt.Inches(0.7), ppt.Inches(1.5), ppt.Inches(8.6), ppt.Inches(1.5)
     )
     eq_frame = eq_box.text_frame
     eq_frame.word_wrap = True
     eq_p = eq_frame.paragraphs[0]
     eq_p.text = "Interface_Temp = β₀ + Σ(β_i × Factor_i) + ε"
-    eq_p.font.size = Pt(32)
+    eq_p.font.size = ppt.Pt(32)
     eq_p.font.bold = True
-    eq_p.font.color.rgb = RGBColor(192, 0, 0)
-    eq_p.alignment = PP_ALIGN.CENTER
+    eq_p.font.color.rgb = ppt.RGBColor(192, 0, 0)
+    eq_p.alignment = ppt.PP_ALIGN.CENTER
     
     # Variable definitions
     def_box = slide.shapes.add_textbox(
-        Inches(0.7), Inches(3.2), Inches(8.6), Inches(2.5)
+        ppt.Inches(0.7), ppt.Inches(3.2), ppt.Inches(8.6), ppt.Inches(2.5)
     )
     def_frame = def_box.text_frame
     def_frame.word_wrap = True
@@ -504,13 +826,13 @@ def create_equation_slide(prs, model_type="Full"):
         else:
             p = def_frame.add_paragraph()
         p.text = definition
-        p.font.size = Pt(18)
-        p.font.color.rgb = RGBColor(50, 50, 50)
+        p.font.size = ppt.Pt(18)
+        p.font.color.rgb = ppt.RGBColor(50, 50, 50)
         p.level = 0
     
     # Model info box
     info_box = slide.shapes.add_textbox(
-        Inches(0.7), Inches(5.9), Inches(8.6), Inches(1.2)
+        ppt.Inches(0.7), ppt.Inches(5.9), ppt.Inches(8.6), ppt.Inches(1.2)
     )
     info_frame = info_box.text_frame
     info_frame.word_wrap = True
@@ -522,9 +844,9 @@ def create_equation_slide(prs, model_type="Full"):
     
     info_p = info_frame.paragraphs[0]
     info_p.text = info_text
-    info_p.font.size = Pt(14)
-    info_p.font.color.rgb = RGBColor(100, 100, 100)
-    info_p.alignment = PP_ALIGN.CENTER
+    info_p.font.size = ppt.Pt(14)
+    info_p.font.color.rgb = ppt.RGBColor(100, 100, 100)
+    info_p.alignment = ppt.PP_ALIGN.CENTER
     
     return slide
 
@@ -542,28 +864,29 @@ def create_content_slide(prs, title, content_type="text", content=None):
     Returns:
         Slide: The created slide
     """
+    ppt = _pptx()
     slide_layout = prs.slide_layouts[6]  # Blank layout
     slide = prs.slides.add_slide(slide_layout)
     
     # Add title
     title_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(0.4), Inches(9), Inches(0.6)
+        ppt.Inches(0.5), ppt.Inches(0.4), ppt.Inches(9), ppt.Inches(0.6)
     )
     title_frame = title_box.text_frame
     title_p = title_frame.paragraphs[0]
     title_p.text = title
-    title_p.font.size = Pt(40)
+    title_p.font.size = ppt.Pt(40)
     title_p.font.bold = True
-    title_p.font.color.rgb = RGBColor(31, 78, 121)
+    title_p.font.color.rgb = ppt.RGBColor(31, 78, 121)
     
     # Add horizontal line
-    line = slide.shapes.add_connector(1, Inches(0.5), Inches(1.1), Inches(9.5), Inches(1.1))
-    line.line.color.rgb = RGBColor(31, 78, 121)
-    line.line.width = Pt(2)
+    line = slide.shapes.add_connector(1, ppt.Inches(0.5), ppt.Inches(1.1), ppt.Inches(9.5), ppt.Inches(1.1))
+    line.line.color.rgb = ppt.RGBColor(31, 78, 121)
+    line.line.width = ppt.Pt(2)
     
     if content_type == "text":
         text_box = slide.shapes.add_textbox(
-            Inches(0.7), Inches(1.4), Inches(8.6), Inches(5.2)
+            ppt.Inches(0.7), ppt.Inches(1.4), ppt.Inches(8.6), ppt.Inches(5.2)
         )
         text_frame = text_box.text_frame
         text_frame.word_wrap = True
@@ -571,36 +894,38 @@ def create_content_slide(prs, title, content_type="text", content=None):
         if isinstance(content, str):
             p = text_frame.paragraphs[0]
             p.text = content
-            p.font.size = Pt(16)
+            p.font.size = ppt.Pt(16)
             p.level = 0
     
-    elif content_type == "table" and isinstance(content, pd.DataFrame):
+    elif content_type == "table" and _is_dataframe(content):
         # Add table
         rows, cols = content.shape
         rows = min(rows + 1, 12)  # Add 1 for header, limit to 12
         
         table_shape = slide.shapes.add_table(
-            rows, cols, Inches(0.5), Inches(1.4), Inches(9), Inches(4.5)
+            rows, cols, ppt.Inches(0.5), ppt.Inches(1.4), ppt.Inches(9), ppt.Inches(4.5)
         ).table
         
         # Set column widths
-        col_width = Inches(9 / cols)
+        col_width = ppt.Inches(9 / cols)
         for col_idx in range(cols):
             table_shape.columns[col_idx].width = col_width
         
+        header_fill = ppt.RGBColor(31, 78, 121)
+        stripe_fill = ppt.RGBColor(242, 242, 242)
+        
         # Add header
         for col_idx, col_name in enumerate(content.columns):
             cell = table_shape.cell(0, col_idx)
             cell.text = str(col_name)
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = RGBColor(31, 78, 121)
+            _set_cell_fill(cell, header_fill)
             
             # Format text
             for paragraph in cell.text_frame.paragraphs:
                 for run in paragraph.runs:
-                    run.font.size = Pt(11)
+                    run.font.size = ppt.Pt(11)
                     run.font.bold = True
-                    run.font.color.rgb = RGBColor(255, 255, 255)
+                    run.font.color.rgb = ppt.RGBColor(255, 255, 255)
         
         # Add data rows
         for row_idx in range(min(len(content), rows - 1)):
@@ -619,23 +944,22 @@ def create_content_slide(prs, title, content_type="text", content=None):
                 
                 # Alternate row colors
                 if row_idx % 2 == 0:
-                    cell.fill.solid()
-                    cell.fill.fore_color.rgb = RGBColor(242, 242, 242)
+                    _set_cell_fill(cell, stripe_fill)
                 
                 for paragraph in cell.text_frame.paragraphs:
                     for run in paragraph.runs:
-                        run.font.size = Pt(10)
+                        run.font.size = ppt.Pt(10)
     
     elif content_type == "image" and content is not None:
         # Add image
         try:
             if isinstance(content, str):  # File path
                 slide.shapes.add_picture(
-                    content, Inches(1), Inches(1.4), width=Inches(8)
+                    content, ppt.Inches(1), ppt.Inches(1.4), width=ppt.Inches(8)
                 )
             else:  # BytesIO object
                 slide.shapes.add_picture(
-                    content, Inches(1), Inches(1.4), width=Inches(8)
+                    content, ppt.Inches(1), ppt.Inches(1.4), width=ppt.Inches(8)
                 )
         except Exception as e:
             print(f"Error adding image: {e}")
@@ -643,23 +967,70 @@ def create_content_slide(prs, title, content_type="text", content=None):
     return slide
 
 
-def add_image_to_slide(slide, image_source, left=Inches(1), top=Inches(1.4), width=Inches(8)):
+def add_image_to_slide(slide, image_source, left=None, top=None, width=None):
     """
     Add an image to an existing slide.
     
     Args:
         slide (Slide): Slide object to add image to
         image_source: Image file path or BytesIO object
-        left: Left position
-        top: Top position
-        width: Image width
+        left: Left position (default 1 inch)
+        top: Top position (default 1.4 inches)
+        width: Image width (default 8 inches)
     """
+    ppt = _pptx()
+    left = ppt.Inches(1) if left is None else left
+    top = ppt.Inches(1.4) if top is None else top
+    width = ppt.Inches(8) if width is None else width
     try:
+        # No extra image cache is needed here: python-pptx looks up image parts
+        # by SHA1, so identical bytes are stored once per presentation and
+        # repeated pictures only add a relationship to the existing part
         slide.shapes.add_picture(image_source, left, top, width=width)
     except Exception as e:
         print(f"Error adding image to slide: {e}")
 
 
+def _save_presentation(prs, output_path):
+    """
+    Serialize a presentation in memory, then write it to disk in one call.
+    
+    The zip archive is built in a BytesIO instead of seeking and writing the
+    output file entry by entry, and a failed save never leaves a truncated
+    .pptx behind.
+    
+    Args:
+        prs (Presentation): PowerPoint presentation object
+        output_path (str): Path to save PowerPoint file
+    """
+    with BytesIO() as buf:
+        prs.save(buf)
+        with buf.getbuffer() as data:
+            Path(output_path).write_bytes(data)
+
+
+def _new_presentation(title, subtitle):
+    """
+    Create a 10 x 7.5 inch presentation that starts with a title slide.
+    
+    Args:
+        title (str): Presentation title
+        subtitle (str): Title slide subtitle
+        
+    Returns:
+        Presentation: The new presentation
+    """
+    ppt = _pptx()
+    prs = ppt.Presentation()
+    prs.slide_width = ppt.Inches(10)
+    prs.slide_height = ppt.Inches(7.5)
+    
+    # Title slide
+    create_title_slide(prs, title, subtitle)
+    return prs
+
+
+@shared_report_caches()
 def create_full_model_powerpoint(html_path, output_path, title="DOE Full Model Analysis"):
     """
     Create a PowerPoint presentation from full model HTML report with specific slide order:
@@ -683,21 +1054,16 @@ def create_full_model_powerpoint(html_path, output_path, title="DOE Full Model A
         print("Error: python-pptx not installed. Install with: pip install python-pptx")
         return False
     
+    import pandas as pd
+    
     try:
-        prs = Presentation()
-        prs.slide_width = Inches(10)
-        prs.slide_height = Inches(7.5)
-        
-        # Title slide
-        create_title_slide(prs, title, "Design of Experiments Analysis")
-        
-        # Extract model diagram image from PDF
-        print("  Extracting model fit plot from PDF...")
-        model_diagram = extract_model_fit_plot_from_pdf(html_path)
+        prs = _new_presentation(title, "Design of Experiments Analysis")
         
-        # Extract other content from HTML (skip first image which is model diagram)
-        images = extract_base64_images_from_html(html_path, max_images=150, skip_first=True)
-        tables = extract_html_tables(html_path)
+        # Extract model diagram from PDF and leverage plots (all images but the
+        # first, which is the model diagram), tables and interaction plots from HTML
+        print("  Extracting model fit plot from PDF and content from HTML...")
+        model_diagram, images, tables, interaction_plots = load_report_content(
+            html_path, max_images=MAX_LEVERAGE_SLIDES)
         
         print(f"Extracted model diagram and {len(images)} leverage plot images, {len(tables)} tables from HTML")
         
@@ -712,13 +1078,12 @@ def create_full_model_powerpoint(html_path, output_path, title="DOE Full Model A
         create_equation_slide(prs, model_type="Full")
         print("  ✓ Added Model Equation slide")
         
+        # Classify every table in a single pass
+        classified = classify_tables(tables)
+        
         # SLIDE 3: Model Comparison Table (Full vs Reduced)
         # Check if comparison table exists in tables
-        comparison_df = None
-        for tbl in tables:
-            if 'Full Model' in tbl.columns and 'Reduced Model' in tbl.columns:
-                comparison_df = tbl
-                break
+        comparison_df = classified.get('comparison')
         
         if comparison_df is None:
             # Create default comparison table
@@ -733,25 +1098,14 @@ def create_full_model_powerpoint(html_path, output_path, title="DOE Full Model A
         print("  ✓ Added Model Comparison slide")
         
         # SLIDE 4: ANOVA Table
-        anova_df = None
-        for tbl in tables:
-            # Look for ANOVA table: has 'df', 'sum_sq' or 'SS', and 'F' columns
-            cols_str = str(tbl.columns).lower()
-            if ('df' in cols_str or 'sum_sq' in cols_str) and 'f' in cols_str and len(tbl) > 2:
-                if 'Lack of Fit' not in str(tbl.values):  # Exclude LOF table
-                    anova_df = tbl.head(15)
-                    break
+        anova_df = classified.get('anova')
         
         if anova_df is not None:
-            create_content_slide(prs, "ANOVA Table (Type I - Sequential)", "table", anova_df)
+            create_content_slide(prs, "ANOVA Table (Type I - Sequential)", "table", anova_df.head(15))
             print("  ✓ Added ANOVA Table slide")
         
         # SLIDE 5: Lack of Fit Table (if available)
-        lof_df = None
-        for tbl in tables:
-            if 'Lack of Fit' in str(tbl.values):
-                lof_df = tbl
-                break
+        lof_df = classified.get('lof')
         
         if lof_df is not None:
             create_content_slide(prs, "Lack of Fit Test", "table", lof_df)
@@ -760,28 +1114,15 @@ def create_full_model_powerpoint(html_path, output_path, title="DOE Full Model A
             print("  ℹ Lack of Fit table not found in full model")
         
         # SLIDE 6: Parameter Table (full parameters sorted by p-value)
-        param_df = None
-        for tbl in tables:
-            # Look for parameters table with Coefficient or coef column
-            cols_str = str(tbl.columns).lower()
-            if 'coefficient' in cols_str or 'coef' in cols_str or 'estimate' in cols_str:
-                param_df = tbl.copy()
-                # Try to sort by p-value if available
-                if 'p-value' in param_df.columns:
-                    param_df = param_df.sort_values('p-value')
-                elif 'P>|t|' in param_df.columns:
-                    param_df = param_df.sort_values('P>|t|')
-                break
+        param_df = classified.get('params')
         
         if param_df is not None:
             # Display top 25 parameters
-            param_display = param_df.head(25)
+            param_display = top_parameters_by_pvalue(param_df, 25)
             create_content_slide(prs, "Parameter Table (Sorted by P-value, Low to High)", "table", param_display)
             print("  ✓ Added Parameter Table slide")
         
         # SLIDE 7: Interaction Plots
-        print("  Extracting interaction plots from HTML...")
-        interaction_plots = extract_interaction_plots_from_html(html_path)
         if interaction_plots:
             for plot_title, plot_image in interaction_plots:
                 create_content_slide(prs, plot_title, "image", plot_image)
@@ -789,12 +1130,9 @@ def create_full_model_powerpoint(html_path, output_path, title="DOE Full Model A
         else:
             print("  ℹ No interaction plots found in HTML")
         
-        # SLIDE 8+: Leverage Plots (all leverage plot images)
+        # SLIDE 8+: Leverage Plots (images is already capped at MAX_LEVERAGE_SLIDES)
         leverage_count = 0
-        for idx, image_io in enumerate(images):
-            if leverage_count > 50:  # Limit leverage plots to 50
-                break
-            
+        for image_io in images:
             slide_title = f"Leverage Plot {leverage_count + 1}"
             create_content_slide(prs, slide_title, "image", image_io)
             leverage_count += 1
@@ -802,17 +1140,16 @@ def create_full_model_powerpoint(html_path, output_path, title="DOE Full Model A
         print(f"  ✓ Added {leverage_count} Leverage Plot slides")
         
         # Save presentation
-        prs.save(output_path)
+        _save_presentation(prs, output_path)
         print(f"✓ PowerPoint saved: {output_path}")
         return True
         
-    except Exception as e:
-        print(f"Error creating PowerPoint presentation: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error creating PowerPoint presentation")
         return False
 
 
+@shared_report_caches()
 def create_reduced_model_powerpoint(html_path, output_path, title="DOE Reduced Model Analysis"):
     """
     Create a PowerPoint presentation from reduced model HTML report with specific slide order:
@@ -836,21 +1173,16 @@ def create_reduced_model_powerpoint(html_path, output_path, title="DOE Reduced M
         print("Error: python-pptx not installed. Install with: pip install python-pptx")
         return False
     
+    import pandas as pd
+    
     try:
-        prs = Presentation()
-        prs.slide_width = Inches(10)
-        prs.slide_height = Inches(7.5)
-        
-        # Title slide
-        create_title_slide(prs, title, "Design of Experiments - Reduced Model")
+        prs = _new_presentation(title, "Design of Experiments - Reduced Model")
         
-        # Extract model diagram image from PDF
-        print("  Extracting model fit plot from PDF...")
-        model_diagram = extract_model_fit_plot_from_pdf(html_path)
-        
-        # Extract other content from HTML (skip first image which is model diagram)
-        images = extract_base64_images_from_html(html_path, max_images=150, skip_first=True)
-        tables = extract_html_tables(html_path)
+        # Extract model diagram from PDF and leverage plots (all images but the
+        # first, which is the model diagram), tables and interaction plots from HTML
+        print("  Extracting model fit plot from PDF and content from HTML...")
+        model_diagram, images, tables, interaction_plots = load_report_content(
+            html_path, max_images=MAX_LEVERAGE_SLIDES)
         
         print(f"Extracted model diagram and {len(images)} leverage plot images, {len(tables)} tables from HTML")
         
@@ -865,13 +1197,12 @@ def create_reduced_model_powerpoint(html_path, output_path, title="DOE Reduced M
         create_equation_slide(prs, model_type="Reduced")
         print("  ✓ Added Model Equation slide")
         
+        # Classify every table in a single pass
+        classified = classify_tables(tables)
+        
         # SLIDE 3: Model Comparison Table (Full vs Reduced)
         # Check if comparison table exists in tables
-        comparison_df = None
-        for tbl in tables:
-            if 'Full Model' in tbl.columns and 'Reduced Model' in tbl.columns:
-                comparison_df = tbl
-                break
+        comparison_df = classified.get('comparison')
         
         if comparison_df is None:
             # Create default comparison table
@@ -886,53 +1217,29 @@ def create_reduced_model_powerpoint(html_path, output_path, title="DOE Reduced M
         print("  ✓ Added Model Comparison slide")
         
         # SLIDE 4: ANOVA Table
-        anova_df = None
-        for tbl in tables:
-            # Look for ANOVA table: has 'df', 'sum_sq' or 'SS', and 'F' columns
-            cols_str = str(tbl.columns).lower()
-            if ('df' in cols_str or 'sum_sq' in cols_str) and 'f' in cols_str and len(tbl) > 2:
-                if 'Lack of Fit' not in str(tbl.values):  # Exclude LOF table
-                    anova_df = tbl.head(15)
-                    break
+        anova_df = classified.get('anova')
         
         if anova_df is not None:
-            create_content_slide(prs, "ANOVA Table (Type I - Sequential)", "table", anova_df)
+            create_content_slide(prs, "ANOVA Table (Type I - Sequential)", "table", anova_df.head(15))
             print("  ✓ Added ANOVA Table slide")
         
         # SLIDE 5: Lack of Fit Table
-        lof_df = None
-        for tbl in tables:
-            if 'Lack of Fit' in str(tbl.values):
-                lof_df = tbl
-                break
+        lof_df = classified.get('lof')
         
         if lof_df is not None:
             create_content_slide(prs, "Lack of Fit Test", "table", lof_df)
             print("  ✓ Added Lack of Fit slide")
         
         # SLIDE 6: Parameter Table (parameters sorted by p-value)
-        param_df = None
-        for tbl in tables:
-            # Look for parameters table with Coefficient or coef column
-            cols_str = str(tbl.columns).lower()
-            if 'coefficient' in cols_str or 'coef' in cols_str or 'estimate' in cols_str:
-                param_df = tbl.copy()
-                # Try to sort by p-value if available
-                if 'p-value' in param_df.columns:
-                    param_df = param_df.sort_values('p-value')
-                elif 'P>|t|' in param_df.columns:
-                    param_df = param_df.sort_values('P>|t|')
-                break
+        param_df = classified.get('params')
         
         if param_df is not None:
             # Display top 25 parameters (reduced model has 451, so top 25 are most significant)
-            param_display = param_df.head(25)
+            param_display = top_parameters_by_pvalue(param_df, 25)
             create_content_slide(prs, "Parameter Table (Sorted by P-value, Low to High)", "table", param_display)
             print("  ✓ Added Parameter Table slide")
         
         # SLIDE 7: Interaction Plots
-        print("  Extracting interaction plots from HTML...")
-        interaction_plots = extract_interaction_plots_from_html(html_path)
         if interaction_plots:
             for plot_title, plot_image in interaction_plots:
                 create_content_slide(prs, plot_title, "image", plot_image)
@@ -940,12 +1247,9 @@ def create_reduced_model_powerpoint(html_path, output_path, title="DOE Reduced M
         else:
             print("  ℹ No interaction plots found in HTML")
         
-        # SLIDE 8+: Leverage Plots (all leverage plot images)
+        # SLIDE 8+: Leverage Plots (images is already capped at MAX_LEVERAGE_SLIDES)
         leverage_count = 0
-        for idx, image_io in enumerate(images):
-            if leverage_count > 50:  # Limit leverage plots to 50
-                break
-            
+        for image_io in images:
             slide_title = f"Leverage Plot {leverage_count + 1}"
             create_content_slide(prs, slide_title, "image", image_io)
             leverage_count += 1
@@ -953,17 +1257,49 @@ def create_reduced_model_powerpoint(html_path, output_path, title="DOE Reduced M
         print(f"  ✓ Added {leverage_count} Leverage Plot slides")
         
         # Save presentation
-        prs.save(output_path)
+        _save_presentation(prs, output_path)
         print(f"✓ PowerPoint saved: {output_path}")
         return True
         
-    except Exception as e:
-        print(f"Error creating PowerPoint presentation: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error creating PowerPoint presentation")
         return False
 
 
+def _add_bold_textbox(slide, templates, key, text, left, top, width, height, size):
+    """
+    Add a single-paragraph bold textbox to a slide.
+    
+    The first textbox built for each key is kept in templates; later ones copy
+    its XML and replace only the text, instead of rebuilding the shape and
+    font properties through python-pptx on every slide.
+    
+    Args:
+        slide (Slide): Slide to add the textbox to
+        templates (dict): Template textbox elements by key, filled on first use
+        key (str): Template key; textboxes sharing a key share position and font
+        text (str): Textbox text
+        left, top, width, height (Length): Textbox position and size
+        size (int): Font size in points
+    """
+    template = templates.get(key)
+    if template is None:
+        ppt = _pptx()
+        txBox = slide.shapes.add_textbox(left, top, width, height)
+        tf = txBox.text_frame
+        tf.text = text
+        tf.paragraphs[0].font.size = ppt.Pt(size)
+        tf.paragraphs[0].font.bold = True
+        templates[key] = txBox._element
+        return
+    
+    sp = copy.deepcopy(template)
+    sp.xpath('.//a:t')[0].text = text
+    sp.nvSpPr.cNvPr.id = slide.shapes._next_shape_id
+    slide.shapes._spTree.insert_element_before(sp, 'p:extLst')
+
+
+@shared_report_caches()
 def add_side_by_side_leverage_comparisons(prs, full_html, reduced_html):
     """
     Add side-by-side comparison slides of leverage plots from full and reduced models.
@@ -978,10 +1314,11 @@ def add_side_by_side_leverage_comparisons(prs, full_html, reduced_html):
     Returns:
         int: Number of comparison slides added
     """
+    ppt = _pptx()
     try:
         # Extract leverage plots (skip first image which is model diagram)
-        full_images = extract_base64_images_from_html(full_html, max_images=150, skip_first=True)
-        reduced_images = extract_base64_images_from_html(reduced_html, max_images=150, skip_first=True)
+        full_images = load_report_images(full_html, max_images=25)
+        reduced_images = load_report_images(reduced_html, max_images=25)
         
         # Use minimum of both to ensure we can pair them
         num_comparisons = min(len(full_images), len(reduced_images))
@@ -992,6 +1329,7 @@ def add_side_by_side_leverage_comparisons(prs, full_html, reduced_html):
         
         # Create comparison slides (2 plots per slide, side by side)
         slides_added = 0
+        textbox_templates = {}
         for idx in range(num_comparisons):
             # Reset BytesIO pointers for reuse
             full_images[idx].seek(0)
@@ -1002,70 +1340,46 @@ def add_side_by_side_leverage_comparisons(prs, full_html, reduced_html):
             slide = prs.slides.add_slide(blank_layout)
             
             # Add title
-            left = Inches(0.5)
-            top = Inches(0.3)
-            width = Inches(9)
-            height = Inches(0.5)
-            txBox = slide.shapes.add_textbox(left, top, width, height)
-            tf = txBox.text_frame
-            tf.text = f"Leverage Comparison {idx + 1}: Full Model vs Reduced Model"
-            tf.paragraphs[0].font.size = Pt(18)
-            tf.paragraphs[0].font.bold = True
+            _add_bold_textbox(slide, textbox_templates, "title",
+                              f"Leverage Comparison {idx + 1}: Full Model vs Reduced Model",
+                              ppt.Inches(0.5), ppt.Inches(0.3), ppt.Inches(9), ppt.Inches(0.5), 18)
             
             # Add full model plot (left side)
             try:
-                from PIL import Image
-                full_pil = Image.open(full_images[idx])
-                left_img = Inches(0.3)
-                top_img = Inches(1)
-                width_img = Inches(4.5)
-                
-                # Calculate height to maintain aspect ratio
-                aspect_ratio = full_pil.height / full_pil.width
-                height_img = width_img * aspect_ratio
+                left_img = ppt.Inches(0.3)
+                top_img = ppt.Inches(1)
+                width_img = ppt.Inches(4.5)
                 
-                # Add to slide
-                slide.shapes.add_picture(BytesIO(full_images[idx].getvalue() if hasattr(full_images[idx], 'getvalue') else full_images[idx].read()),
-                                        left_img, top_img, width=width_img)
+                # Add to slide; python-pptx keeps the aspect ratio when only width is given
+                slide.shapes.add_picture(full_images[idx], left_img, top_img, width=width_img)
                 
                 # Add label
-                label_box = slide.shapes.add_textbox(left_img, top_img - Inches(0.3), width_img, Inches(0.3))
-                label_tf = label_box.text_frame
-                label_tf.text = "Full Model"
-                label_tf.paragraphs[0].font.size = Pt(12)
-                label_tf.paragraphs[0].font.bold = True
+                _add_bold_textbox(slide, textbox_templates, "Full Model", "Full Model",
+                                  left_img, top_img - ppt.Inches(0.3), width_img, ppt.Inches(0.3), 12)
             except Exception as e:
-                print(f"  ! Error adding full model plot to slide {idx + 1}: {str(e)[:50]}")
+                logger.warning("Error adding full model plot to slide %d: %.50s", idx + 1, e)
             
             # Add reduced model plot (right side)
             try:
-                from PIL import Image
-                reduced_pil = Image.open(reduced_images[idx])
-                left_img = Inches(5.2)
-                top_img = Inches(1)
-                width_img = Inches(4.5)
+                left_img = ppt.Inches(5.2)
+                top_img = ppt.Inches(1)
+                width_img = ppt.Inches(4.5)
                 
-                slide.shapes.add_picture(BytesIO(reduced_images[idx].getvalue() if hasattr(reduced_images[idx], 'getvalue') else reduced_images[idx].read()),
-                                        left_img, top_img, width=width_img)
+                slide.shapes.add_picture(reduced_images[idx], left_img, top_img, width=width_img)
                 
                 # Add label
-                label_box = slide.shapes.add_textbox(left_img, top_img - Inches(0.3), width_img, Inches(0.3))
-                label_tf = label_box.text_frame
-                label_tf.text = "Reduced Model"
-                label_tf.paragraphs[0].font.size = Pt(12)
-                label_tf.paragraphs[0].font.bold = True
+                _add_bold_textbox(slide, textbox_templates, "Reduced Model", "Reduced Model",
+                                  left_img, top_img - ppt.Inches(0.3), width_img, ppt.Inches(0.3), 12)
             except Exception as e:
-                print(f"  ! Error adding reduced model plot to slide {idx + 1}: {str(e)[:50]}")
+                logger.warning("Error adding reduced model plot to slide %d: %.50s", idx + 1, e)
             
             slides_added += 1
         
         print(f"  ✓ Added {slides_added} side-by-side leverage comparison slides")
         return slides_added
         
-    except Exception as e:
-        print(f"  ! Error creating side-by-side leverage comparisons: {str(e)[:100]}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error creating side-by-side leverage comparisons")
         return 0
 
 
@@ -1088,14 +1402,8 @@ def create_comparison_powerpoint(full_html, reduced_html, output_path,
     if not PPTX_AVAILABLE:
         print("Error: python-pptx not installed. Install with: pip install python-pptx")
         return False
-    
     try:
-        prs = Presentation()
-        prs.slide_width = Inches(10)
-        prs.slide_height = Inches(7.5)
-        
-        # Title slide
-        create_title_slide(prs, title, "Statistical Analysis Comparison")
+        prs = _new_presentation(title, "Statistical Analysis Comparison")
         
         # Add comparison metrics slide
         comparison_metrics = """
@@ -1117,10 +1425,6 @@ Verdict: Successful model reduction with maintained prediction accuracy
         """
         create_content_slide(prs, "Model Metrics Comparison", "text", comparison_metrics)
         
-        # Extract images from both models
-        full_images = extract_base64_images_from_html(full_html, max_images=25)
-        reduced_images = extract_base64_images_from_html(reduced_html, max_images=25)
-        
         # Add full model section
         create_content_slide(prs, "Full Model Analysis", "text", 
                            "Detailed analysis of the full 820-parameter model")
@@ -1130,15 +1434,63 @@ Verdict: Successful model reduction with maintained prediction accuracy
                            "Streamlined analysis of the 451-parameter reduced model")
         
         # Save presentation
-        prs.save(output_path)
+        _save_presentation(prs, output_path)
         print(f"✓ Comparison PowerPoint saved: {output_path}")
         return True
         
-    except Exception as e:
-        print(f"Error creating comparison PowerPoint presentation: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error creating comparison PowerPoint presentation")
+        return False
+
+
+_BUILD_BUFFER = contextvars.ContextVar("_BUILD_BUFFER", default=None)
+
+
+class _BuildOutput:
+    """
+    sys.stdout stand-in that buffers the prints of each concurrent build.
+    
+    Writes from a thread running capture() (or from threads it starts with a
+    copied context, as load_report_content does) go to that build's buffer;
+    all other writes go straight to the wrapped stream. Used as a context
+    manager, it replaces sys.stdout and restores it on exit.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def __enter__(self):
+        sys.stdout = self
+        return self
+    
+    def __exit__(self, *exc_info):
+        sys.stdout = self._stream
         return False
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+    
+    def write(self, text):
+        buffer = _BUILD_BUFFER.get()
+        return (self._stream if buffer is None else buffer).write(text)
+    
+    def flush(self):
+        if _BUILD_BUFFER.get() is None:
+            self._stream.flush()
+    
+    def capture(self, func, *args, **kwargs):
+        """
+        Call func with its prints buffered.
+        
+        Returns:
+            tuple: (func's return value, everything it printed)
+        """
+        buffer = StringIO()
+        token = _BUILD_BUFFER.set(buffer)
+        try:
+            return func(*args, **kwargs), buffer.getvalue()
+        finally:
+            _BUILD_BUFFER.reset(token)
 
 
 def convert_html_to_powerpoint():
@@ -1156,56 +1508,74 @@ def convert_html_to_powerpoint():
     output_dir = Path("outputs")
     results = {"status": "starting", "conversions": {}}
     
-    # Full model
     full_html = output_dir / "doe_analysis_report.html"
     full_pptx = output_dir / "doe_analysis_report.pptx"
-    
-    if full_html.exists():
-        print(f"\nConverting full model HTML to PowerPoint...")
-        success = create_full_model_powerpoint(
-            str(full_html), 
-            str(full_pptx),
-            title="DOE Full Model Analysis (820 Parameters)"
-        )
-        results["conversions"]["full_model"] = {
-            "input": str(full_html),
-            "output": str(full_pptx),
-            "success": success
-        }
-    
-    # Reduced model
     reduced_html = output_dir / "doe_analysis_reduced.html"
     reduced_pptx = output_dir / "doe_analysis_reduced.pptx"
+    comparison_pptx = output_dir / "doe_model_comparison.pptx"
     
-    if reduced_html.exists():
-        print(f"\nConverting reduced model HTML to PowerPoint...")
-        success = create_reduced_model_powerpoint(
-            str(reduced_html),
-            str(reduced_pptx),
-            title="DOE Reduced Model Analysis (451 Parameters)"
-        )
-        results["conversions"]["reduced_model"] = {
-            "input": str(reduced_html),
-            "output": str(reduced_pptx),
-            "success": success
-        }
-    
-    # Comparison
-    if full_html.exists() and reduced_html.exists():
-        print(f"\nCreating comparison PowerPoint...")
-        comparison_pptx = output_dir / "doe_model_comparison.pptx"
-        success = create_comparison_powerpoint(
-            str(full_html),
-            str(reduced_html),
-            str(comparison_pptx),
-            title="Full vs Reduced Model Comparison"
-        )
-        results["conversions"]["comparison"] = {
-            "full_model_input": str(full_html),
-            "reduced_model_input": str(reduced_html),
-            "output": str(comparison_pptx),
-            "success": success
-        }
+    # The three builds are independent and spend most of their time in native
+    # code (lxml, zlib, PIL, Kaleido), so run them concurrently. Report
+    # extraction is cached per file, so each HTML report is still parsed once.
+    jobs = {}
+    # Each build's prints are buffered and shown as one block when it finishes,
+    # so the concurrent builds do not interleave their progress lines. The
+    # extracted report content is shared by all three builds and released
+    # once every deck is saved.
+    with shared_report_caches(), _BuildOutput(sys.stdout) as output, \
+            ThreadPoolExecutor(max_workers=3) as executor:
+        # Full model
+        if full_html.exists():
+            future = executor.submit(
+                output.capture,
+                create_full_model_powerpoint,
+                str(full_html),
+                str(full_pptx),
+                title="DOE Full Model Analysis (820 Parameters)"
+            )
+            jobs["full_model"] = ("\nConverting full model HTML to PowerPoint...", {
+                "input": str(full_html),
+                "output": str(full_pptx)
+            }, future)
+        
+        # Reduced model
+        if reduced_html.exists():
+            future = executor.submit(
+                output.capture,
+                create_reduced_model_powerpoint,
+                str(reduced_html),
+                str(reduced_pptx),
+                title="DOE Reduced Model Analysis (451 Parameters)"
+            )
+            jobs["reduced_model"] = ("\nConverting reduced model HTML to PowerPoint...", {
+                "input": str(reduced_html),
+                "output": str(reduced_pptx)
+            }, future)
+        
+        # Comparison
+        if full_html.exists() and reduced_html.exists():
+            future = executor.submit(
+                output.capture,
+                create_comparison_powerpoint,
+                str(full_html),
+                str(reduced_html),
+                str(comparison_pptx),
+                title="Full vs Reduced Model Comparison"
+            )
+            jobs["comparison"] = ("\nCreating comparison PowerPoint...", {
+                "full_model_input": str(full_html),
+                "reduced_model_input": str(reduced_html),
+                "output": str(comparison_pptx)
+            }, future)
+        
+        # Collect in submission order so the summary stays stable; each block
+        # is printed as soon as its build (and those before it) has finished
+        for conversion_type, (header, details, future) in jobs.items():
+            success, build_output = future.result()
+            print(header)
+            print(build_output, end="")
+            details["success"] = success
+            results["conversions"][conversion_type] = details
     
     results["status"] = "complete"
     return results
@@ -2,6 +2,8 @@
 Data preparation module for processing cleaned dataframes.
 Handles feature engineering and data transformations.
 """
+import warnings
+import numpy as np
 import plotly.graph_objects as go
 from pathlib import Path
 
@@ -30,8 +32,13 @@ def calculate_fan_speed_mean(csv_clean_df):
         'Fan_FanTray4Fan1Sensor1'
     ]
     
-    # Calculate the mean across the four fan trays and add to new column
-    mean_fan_df['fan_speed_mean'] = mean_fan_df[fan_sensor_columns].mean(axis=1)
+    # Calculate the mean across the four fan trays and add to new column.
+    # A single NumPy reduction over the sensor block avoids pandas' row-wise
+    # reduction machinery; all-NaN rows yield NaN, as DataFrame.mean does.
+    fan_speeds = mean_fan_df[fan_sensor_columns].to_numpy(dtype=np.float64)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        mean_fan_df['fan_speed_mean'] = np.nanmean(fan_speeds, axis=1)
     
     return mean_fan_df
 
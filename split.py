@@ -17,8 +17,11 @@ def split_fan(mean_fan_df):
     Returns:
         tuple: (fan_low_df, fan_high_df) - Two dataframes split by threshold
     """
+    # Pull the column out once and build both masks on the raw NumPy array
+    fan_speed = mean_fan_df['fan_speed_mean'].to_numpy()
+    
     # Split dataframe based on fan speed threshold
-    fan_low_df = mean_fan_df[mean_fan_df['fan_speed_mean'] < 9999].copy()
-    fan_high_df = mean_fan_df[mean_fan_df['fan_speed_mean'] >= 10000].copy()
+    fan_low_df = mean_fan_df.iloc[fan_speed < 9999].copy()
+    fan_high_df = mean_fan_df.iloc[fan_speed >= 10000].copy()
     
     return fan_low_df, fan_high_df
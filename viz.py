@@ -2,290 +2,480 @@
 Visualization module for comparative histogram analysis.
 Handles creating side-by-side distribution comparisons with statistics.
 """
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import hashlib
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
 from pathlib import Path
 
+# Plotly is slow to import, so it is imported when a figure is first built
 
-def create_fan_hl_histogram(balanced_low_df, balanced_high_df, output_dir='outputs'):
+# Page written for each comparison figure. Plotly.js is loaded from the CDN,
+# as the DOE report plots do, instead of inlining the ~3.5 MB bundle into every
+# histogram file. Filling this in directly skips fig.write_html's rendering
+# pipeline, which takes over ten times as long as serializing the figure.
+HTML_TEMPLATE = """<html>
+<head><meta charset="utf-8" /></head>
+<body>
+    <div id="{div_id}" class="plotly-graph-div" style="height:{height}px; width:100%;"></div>
+    <script src="https://cdn.plot.ly/plotly-{plotlyjs_version}.min.js" charset="utf-8"></script>
+    <script type="text/javascript">
+        var figure = {figure_json};
+        Plotly.newPlot("{div_id}", figure.data, figure.layout, {{"responsive": true}});
+    </script>
+</body>
+</html>
+"""
+
+# Part of every figure's input hash, so figures written by older code are
+# rebuilt; bump it whenever the binning, statistics or rendering code changes
+FIGURE_CACHE_VERSION = 1
+
+# Per-chart settings for the low vs high speed comparison histograms
+FAN_HL_SPEC = {
+    'title': 'Fan Speed Distribution Comparison: Low vs High Speed Fans',
+    'xlabel': 'Fan Speed Mean (RPM)',
+    'mean_unit': '',
+    'x_range': None,
+    'filename': 'fan_hl_histogram.html',
+    'low': {'nbins': 40, 'color': '#1f77b4', 'line_color': '#0d47a1'},
+    'high': {'nbins': 40, 'color': '#ff7f0e', 'line_color': '#d62728'},
+}
+
+TTEMP_HL_SPEC = {
+    'title': 'Interface Temperature Distribution Comparison: Low vs High Speed Fans',
+    'xlabel': 'Interface Temperature (°C)',
+    'mean_unit': '°C',
+    # 50-130°C for both histograms with 10-degree tick marks
+    'x_range': [50, 130],
+    'filename': 'ttemp_hl_histogram.html',
+    # Binned by 1-degree Celsius increments on whole degrees; a side's
+    # 'bin_width' takes the place of 'nbins' and is bounded by 'x_range', so
+    # each trace has at most 80 bars however far out a reading lies
+    'low': {'bin_width': 1, 'color': '#2ca02c', 'line_color': '#1f8f1f'},
+    'high': {'bin_width': 1, 'color': '#d62728', 'line_color': '#8b0000'},
+}
+
+
+def _summary_stats(values):
     """
-    Create side-by-side histograms comparing low and high speed fan distributions.
+    Compute the statistics shown in the histogram annotations.
     
-    Creates an interactive HTML visualization with separate histograms for low and
-    high speed fans, including statistics (mean, std dev, variance, count).
+    Args:
+        values (np.ndarray): 1-D float array without missing values
+        
+    Returns:
+        dict: 'mean', 'std', 'var' and 'count' of values
+    """
+    # NaN mean for no values and NaN std/var for fewer than two, as with pandas
+    count = values.size
+    mean = values.mean(dtype=np.float64) if count else math.nan
+    var = values.var(ddof=1, dtype=np.float64) if count > 1 else math.nan
+    std = math.sqrt(var)
+    return {'mean': mean, 'std': std, 'var': var, 'count': count}
+
+
+def _column_values(df, column):
+    """
+    Return a column as a float32 array with missing values removed.
+    
+    A single NaN mask replaces Series.dropna, so no intermediate Series is built
+    before the statistics and binning. Fan speeds and temperatures need far less
+    than float32 precision for binning, and half-width values halve the memory
+    read by the histogram and hashing passes; statistics accumulate in float64.
     
     Args:
-        balanced_low_df (pd.DataFrame): Balanced dataframe with low speed fans
-        balanced_high_df (pd.DataFrame): Balanced dataframe with high speed fans
-        output_dir (str): Directory where the HTML file will be saved
+        df (pd.DataFrame): Source dataframe
+        column (str): Column name
         
     Returns:
-        str: Path to the generated HTML file
+        np.ndarray: Non-missing values of the column
     """
-    # Create output directory if it doesn't exist
-    output_path = Path(output_dir)
-    output_path.mkdir(exist_ok=True)
-    
-    # Extract fan speed data
-    low_speed_data = balanced_low_df['fan_speed_mean'].dropna()
-    high_speed_data = balanced_high_df['fan_speed_mean'].dropna()
-    
-    # Calculate statistics
-    low_stats = {
-        'mean': low_speed_data.mean(),
-        'std': low_speed_data.std(),
-        'var': low_speed_data.var(),
-        'count': len(low_speed_data)
-    }
-    
-    high_stats = {
-        'mean': high_speed_data.mean(),
-        'std': high_speed_data.std(),
-        'var': high_speed_data.var(),
-        'count': len(high_speed_data)
-    }
+    values = df[column].to_numpy(dtype=np.float32)
+    return values[~np.isnan(values)]
+
+
+def _bin_counts(values, edges):
+    """
+    Count values into equal-width bins the way np.histogram does.
     
-    # Create subplots
-    fig = make_subplots(
-        rows=1, cols=2,
-        subplot_titles=('Low (< 9999 rpm)', 'High (>= 10,000 rpm)'),
-        specs=[[{'secondary_y': False}, {'secondary_y': False}]]
-    )
+    Each bin is half-open except the last, which also holds the last edge.
+    Passing the range as float64 makes np.histogram build float64 edges and
+    compare the values against them, so a value on an inner edge always lands
+    in the bin that edge opens; with float32 values and a bin count alone, its
+    edges would be float32. Its equal-width path computes each bin index
+    arithmetically and corrects it against the edges, without a bin search.
     
-    # Add low speed histogram
-    fig.add_trace(
-        go.Histogram(
-            x=low_speed_data,
-            nbinsx=40,
-            name='Low Speed',
-            marker=dict(color='#1f77b4', line=dict(color='#0d47a1', width=1.5)),
-            showlegend=False
-        ),
-        row=1, col=1
-    )
+    Args:
+        values (np.ndarray): 1-D float array without missing values
+        edges (np.ndarray): Increasing, equally spaced float64 bin edges
+        
+    Returns:
+        np.ndarray: Count per bin
+    """
+    counts, _ = np.histogram(values, bins=edges.size - 1, range=(edges[0], edges[-1]))
+    return counts
+
+
+def _bin_edges(values, side, x_range):
+    """
+    Compute the histogram bin edges for one subplot.
     
-    # Add high speed histogram
-    fig.add_trace(
-        go.Histogram(
-            x=high_speed_data,
-            nbinsx=40,
-            name='High Speed',
-            marker=dict(color='#ff7f0e', line=dict(color='#d62728', width=1.5)),
-            showlegend=False
-        ),
-        row=1, col=2
-    )
+    With 'nbins', the bins have equal widths spanning the range of values, as
+    np.histogram(values, bins=nbins) would make them (in float64). With
+    'bin_width', the edges fall on multiples of the width that cover the values
+    within x_range; values outside it are left out of the counts, as they are
+    off the axis anyway.
     
-    # Create statistics text for low speed
-    low_stats_text = (
-        f'<b>Low Speed Statistics</b><br>'
-        f'Mean: {low_stats["mean"]:.2f}<br>'
-        f'Std Dev: {low_stats["std"]:.2f}<br>'
-        f'Variance: {low_stats["var"]:.2f}<br>'
-        f'Count: {low_stats["count"]:,}'
-    )
+    Args:
+        values (np.ndarray): 1-D float array without missing values
+        side (dict): Low or high settings of a chart spec, see TTEMP_HL_SPEC
+        x_range (list): [min, max] of the x axis; required with 'bin_width'
+        
+    Returns:
+        np.ndarray: Increasing float64 bin edges
+    """
+    if values.size:
+        lo = float(values.min())
+        hi = float(values.max())
+    else:
+        # np.histogram's range for no values
+        lo, hi = 0.0, 1.0
+    
+    if 'bin_width' in side:
+        width = side['bin_width']
+        lo = min(max(lo, x_range[0]), x_range[1])
+        hi = max(min(hi, x_range[1]), x_range[0])
+        start = math.floor(lo / width)
+        stop = max(math.ceil(hi / width), start + 1)
+        return np.arange(start, stop + 1) * float(width)
+    
+    if lo == hi:
+        # np.histogram widens a zero-width range by 0.5 on each side
+        lo -= 0.5
+        hi += 0.5
+    return np.linspace(lo, hi, side['nbins'] + 1)
+
+
+def _summarize_side(values, side, x_range):
+    """
+    Compute the statistics and histogram bins for one subplot.
     
-    # Create statistics text for high speed
-    high_stats_text = (
-        f'<b>High Speed Statistics</b><br>'
-        f'Mean: {high_stats["mean"]:.2f}<br>'
-        f'Std Dev: {high_stats["std"]:.2f}<br>'
-        f'Variance: {high_stats["var"]:.2f}<br>'
-        f'Count: {high_stats["count"]:,}'
-    )
+    Args:
+        values (np.ndarray): 1-D float array without missing values
+        side (dict): Low or high settings of a chart spec, see TTEMP_HL_SPEC
+        x_range (list): [min, max] of the x axis, or None
+        
+    Returns:
+        tuple: (stats, counts, edges) from _summary_stats, _bin_counts and _bin_edges
+    """
+    edges = _bin_edges(values, side, x_range)
+    return _summary_stats(values), _bin_counts(values, edges), edges
+
+
+@lru_cache(maxsize=32)
+def _ensured_dir(output_dir):
+    """
+    Create an output directory once per process and return it as a Path.
     
-    # Add annotations for statistics
-    fig.add_annotation(
-        text=low_stats_text,
-        xref='x domain', yref='y domain',
-        x=0.98, y=0.97,
-        showarrow=False,
-        bgcolor='rgba(255, 255, 255, 0.8)',
-        bordercolor='#1f77b4',
-        borderwidth=2,
-        align='left',
-        xanchor='right',
-        yanchor='top',
-        font=dict(size=11),
-        row=1, col=1
-    )
+    Later calls for the same directory skip the mkdir system call; a directory
+    removed while the process runs is not recreated.
+    
+    Args:
+        output_dir (str): Directory path
+        
+    Returns:
+        Path: The directory
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    return output_path
+
+
+def _figure_input_hash(rows, title):
+    """
+    Hash everything a comparison histogram figure is built from.
+    
+    Args:
+        rows (list): (low_data, high_data, spec) tuples, one per figure row
+        title (str): Figure title
+        
+    Returns:
+        str: Hex digest (also covering FIGURE_CACHE_VERSION, HTML_TEMPLATE and
+            the Plotly.js version) identifying the figure's inputs
+    """
+    from plotly.offline import get_plotlyjs_version
+    
+    specs = [spec for _, _, spec in rows]
+    h = hashlib.sha1(json.dumps(
+        [FIGURE_CACHE_VERSION, get_plotlyjs_version(), title, specs, HTML_TEMPLATE],
+        sort_keys=True).encode())
+    for low_data, high_data, _ in rows:
+        for values in (low_data, high_data):
+            # The length separates the arrays so bytes cannot shift between them
+            h.update(str(values.size).encode())
+            h.update(values.tobytes())
+    return h.hexdigest()
+
+
+def _add_hl_row(fig, row, low_summary, high_summary, spec):
+    """
+    Add a low and a high speed histogram with statistics to one figure row.
+    
+    Args:
+        fig (plotly.graph_objects.Figure): Figure made with make_subplots(cols=2)
+        row (int): Figure row to fill (1-based)
+        low_summary (tuple): _summarize_side result for low speed fans
+        high_summary (tuple): _summarize_side result for high speed fans
+        spec (dict): Chart settings, see FAN_HL_SPEC
+    """
+    import plotly.graph_objects as go
+    
+    for col, label, (stats, counts, edges) in ((1, 'Low', low_summary), (2, 'High', high_summary)):
+        side = spec[label.lower()]
+        
+        # The data was binned in _summarize_side and the counts are plotted as
+        # bars, so the HTML carries one value per bin instead of every sample
+        fig.add_trace(
+            go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=edges[1] - edges[0],
+                name=f'{label} Speed',
+                marker=dict(color=side['color'], line=dict(color=side['line_color'], width=1.5)),
+                showlegend=False
+            ),
+            row=row, col=col
+        )
+        
+        # Add statistics annotation
+        stats_text = (
+            f'<b>{label} Speed Statistics</b><br>'
+            f'Mean: {stats["mean"]:.2f}{spec["mean_unit"]}<br>'
+            f'Std Dev: {stats["std"]:.2f}<br>'
+            f'Variance: {stats["var"]:.2f}<br>'
+            f'Count: {stats["count"]:,}'
+        )
+        fig.add_annotation(
+            text=stats_text,
+            xref='x domain', yref='y domain',
+            x=0.98, y=0.97,
+            showarrow=False,
+            bgcolor='rgba(255, 255, 255, 0.8)',
+            bordercolor=side['color'],
+            borderwidth=2,
+            align='left',
+            xanchor='right',
+            yanchor='top',
+            font=dict(size=11),
+            row=row, col=col
+        )
+    
+    # Update x and y axes labels (and range, if fixed) on both subplots of the row
+    fig.update_xaxes(title_text=spec['xlabel'], row=row)
+    fig.update_yaxes(title_text='Frequency', row=row)
+    if spec['x_range'] is not None:
+        fig.update_xaxes(range=spec['x_range'], dtick=10, row=row)
+
+
+@lru_cache(maxsize=4)
+def _base_figure(nrows):
+    """
+    Build the empty subplot grid and shared layout for an nrows-row comparison figure.
+    
+    Built once per row count; callers copy it with go.Figure(...), which is about
+    twice as fast as validating the subplot scaffold and layout again. The
+    returned figure itself must not be modified.
     
-    fig.add_annotation(
-        text=high_stats_text,
-        xref='x domain', yref='y domain',
-        x=0.98, y=0.97,
-        showarrow=False,
-        bgcolor='rgba(255, 255, 255, 0.8)',
-        bordercolor='#ff7f0e',
-        borderwidth=2,
-        align='left',
-        xanchor='right',
-        yanchor='top',
-        font=dict(size=11),
-        row=1, col=2
+    Args:
+        nrows (int): Number of low vs high speed rows
+        
+    Returns:
+        plotly.graph_objects.Figure: Figure without traces or title
+    """
+    from plotly.subplots import make_subplots
+    
+    # Create subplots
+    fig = make_subplots(
+        rows=nrows, cols=2,
+        subplot_titles=('Low (< 9999 rpm)', 'High (>= 10,000 rpm)') * nrows,
+        specs=[[{'secondary_y': False}, {'secondary_y': False}]] * nrows
     )
     
     # Update layout
     fig.update_layout(
-        title_text='Fan Speed Distribution Comparison: Low vs High Speed Fans',
-        height=600,
+        height=100 + 500 * nrows,
         showlegend=False,
         template='plotly_white',
         margin=dict(l=100, r=100, t=100, b=50)
     )
+    return fig
+
+
+def _render_html(fig, div_id):
+    """
+    Render a figure as a standalone HTML page from HTML_TEMPLATE.
     
-    # Update x and y axes labels
-    fig.update_xaxes(title_text='Fan Speed Mean (RPM)', row=1, col=1)
-    fig.update_xaxes(title_text='Fan Speed Mean (RPM)', row=1, col=2)
-    fig.update_yaxes(title_text='Frequency', row=1, col=1)
-    fig.update_yaxes(title_text='Frequency', row=1, col=2)
-    
-    # Save HTML file
-    html_file = output_path / 'fan_hl_histogram.html'
-    fig.write_html(str(html_file))
-    
-    return str(html_file)
+    Args:
+        fig (plotly.graph_objects.Figure): Figure to render
+        div_id (str): id of the div the figure is drawn in
+        
+    Returns:
+        str: HTML page
+    """
+    import plotly.io as pio
+    from plotly.offline import get_plotlyjs_version
+    
+    # Escape "</" as Plotly's own HTML export does, so text in the figure
+    # cannot close the script element
+    figure_json = pio.to_json(fig, validate=False).replace('</', '<\\/')
+    return HTML_TEMPLATE.format(
+        div_id=div_id,
+        height=fig.layout.height,
+        plotlyjs_version=get_plotlyjs_version(),
+        figure_json=figure_json
+    )
 
 
-def create_ttemp_hl_histogram(balanced_low_df, balanced_high_df, output_dir='outputs'):
+def _write_hl_figure(rows, title, filename, output_dir):
     """
-    Create side-by-side histograms comparing interface temperature distributions.
+    Build and save a figure with one row of low vs high speed histograms per input.
     
-    Creates an interactive HTML visualization with separate histograms for low and
-    high speed fans' interface temperatures, including statistics.
+    A hash of the inputs is stored next to the HTML file; when it matches, the
+    existing file is returned without rebuilding or re-serializing the figure.
     
     Args:
-        balanced_low_df (pd.DataFrame): Balanced dataframe with low speed fans
-        balanced_high_df (pd.DataFrame): Balanced dataframe with high speed fans
+        rows (list): (low_data, high_data, spec) tuples, one per figure row
+        title (str): Figure title
+        filename (str): Name of the HTML file
         output_dir (str): Directory where the HTML file will be saved
-        
+    
     Returns:
         str: Path to the generated HTML file
     """
+    import plotly.graph_objects as go
+    
     # Create output directory if it doesn't exist
-    output_path = Path(output_dir)
-    output_path.mkdir(exist_ok=True)
-    
-    # Extract interface temperature data
-    low_temp_data = balanced_low_df['Interface_Temp'].dropna()
-    high_temp_data = balanced_high_df['Interface_Temp'].dropna()
-    
-    # Calculate statistics
-    low_stats = {
-        'mean': low_temp_data.mean(),
-        'std': low_temp_data.std(),
-        'var': low_temp_data.var(),
-        'count': len(low_temp_data)
-    }
-    
-    high_stats = {
-        'mean': high_temp_data.mean(),
-        'std': high_temp_data.std(),
-        'var': high_temp_data.var(),
-        'count': len(high_temp_data)
-    }
+    output_path = _ensured_dir(str(output_dir))
+    
+    # Skip the build when the same inputs produced the existing file
+    html_file = output_path / filename
+    hash_file = output_path / f'{filename}.hash'
+    input_hash = _figure_input_hash(rows, title)
+    if html_file.exists() and hash_file.exists() and hash_file.read_text() == input_hash:
+        return str(html_file)
+    
+    # Summarize every subplot's data in parallel (NumPy releases the GIL)
+    # while the figure is being set up
+    with ThreadPoolExecutor(max_workers=2 * len(rows)) as executor:
+        summaries = [
+            (executor.submit(_summarize_side, low_data, spec['low'], spec['x_range']),
+             executor.submit(_summarize_side, high_data, spec['high'], spec['x_range']))
+            for low_data, high_data, spec in rows
+        ]
+        
+        # Copy the prepared subplot grid and set this figure's title
+        fig = go.Figure(_base_figure(len(rows)))
+        fig.update_layout(title_text=title)
     
-    # Create subplots
-    fig = make_subplots(
-        rows=1, cols=2,
-        subplot_titles=('Low (< 9999 rpm)', 'High (>= 10,000 rpm)'),
-        specs=[[{'secondary_y': False}, {'secondary_y': False}]]
-    )
+    for row, ((low_future, high_future), (_, _, spec)) in enumerate(zip(summaries, rows), start=1):
+        _add_hl_row(fig, row, low_future.result(), high_future.result(), spec)
     
-    # Add low speed histogram (binned by 1-degree Celsius increments: 60-75°C = 15 bins)
-    fig.add_trace(
-        go.Histogram(
-            x=low_temp_data,
-            nbinsx=15,
-            name='Low Speed',
-            marker=dict(color='#2ca02c', line=dict(color='#1f8f1f', width=1.5)),
-            showlegend=False
-        ),
-        row=1, col=1
-    )
+    # Save HTML file, then the hash of the inputs it was built from
+    # Encoded up front, the page goes to disk in one write without the text layer
+    html_file.write_bytes(_render_html(fig, Path(filename).stem).encode('utf-8'))
+    hash_file.write_text(input_hash)
     
-    # Add high speed histogram (binned by 1-degree Celsius increments: 60-130°C = 70 bins)
-    fig.add_trace(
-        go.Histogram(
-            x=high_temp_data,
-            nbinsx=70,
-            name='High Speed',
-            marker=dict(color='#d62728', line=dict(color='#8b0000', width=1.5)),
-            showlegend=False
-        ),
-        row=1, col=2
-    )
+    return str(html_file)
+
+
+def _create_hl_histogram(low_data, high_data, spec, output_dir):
+    """
+    Create side-by-side histograms comparing a low and a high speed fan series.
     
-    # Create statistics text for low speed
-    low_stats_text = (
-        f'<b>Low Speed Statistics</b><br>'
-        f'Mean: {low_stats["mean"]:.2f}°C<br>'
-        f'Std Dev: {low_stats["std"]:.2f}<br>'
-        f'Variance: {low_stats["var"]:.2f}<br>'
-        f'Count: {low_stats["count"]:,}'
-    )
+    Args:
+        low_data (np.ndarray): Values for low speed fans, without missing values
+        high_data (np.ndarray): Values for high speed fans, without missing values
+        spec (dict): Chart settings, see FAN_HL_SPEC
+        output_dir (str): Directory where the HTML file will be saved
     
-    # Create statistics text for high speed
-    high_stats_text = (
-        f'<b>High Speed Statistics</b><br>'
-        f'Mean: {high_stats["mean"]:.2f}°C<br>'
-        f'Std Dev: {high_stats["std"]:.2f}<br>'
-        f'Variance: {high_stats["var"]:.2f}<br>'
-        f'Count: {high_stats["count"]:,}'
-    )
+    Returns:
+        str: Path to the generated HTML file
+    """
+    return _write_hl_figure([(low_data, high_data, spec)], spec['title'], spec['filename'], output_dir)
+
+
+def create_fan_hl_histogram(balanced_low_df, balanced_high_df, output_dir='outputs'):
+    """
+    Create side-by-side histograms comparing low and high speed fan distributions.
     
-    # Add annotations for statistics
-    fig.add_annotation(
-        text=low_stats_text,
-        xref='x domain', yref='y domain',
-        x=0.98, y=0.97,
-        showarrow=False,
-        bgcolor='rgba(255, 255, 255, 0.8)',
-        bordercolor='#2ca02c',
-        borderwidth=2,
-        align='left',
-        xanchor='right',
-        yanchor='top',
-        font=dict(size=11),
-        row=1, col=1
-    )
+    Creates an interactive HTML visualization with separate histograms for low and
+    high speed fans, including statistics (mean, std dev, variance, count).
     
-    fig.add_annotation(
-        text=high_stats_text,
-        xref='x domain', yref='y domain',
-        x=0.98, y=0.97,
-        showarrow=False,
-        bgcolor='rgba(255, 255, 255, 0.8)',
-        bordercolor='#d62728',
-        borderwidth=2,
-        align='left',
-        xanchor='right',
-        yanchor='top',
-        font=dict(size=11),
-        row=1, col=2
-    )
+    Args:
+        balanced_low_df (pd.DataFrame): Balanced dataframe with low speed fans
+        balanced_high_df (pd.DataFrame): Balanced dataframe with high speed fans
+        output_dir (str): Directory where the HTML file will be saved
     
-    # Update layout
-    fig.update_layout(
-        title_text='Interface Temperature Distribution Comparison: Low vs High Speed Fans',
-        height=600,
-        showlegend=False,
-        template='plotly_white',
-        margin=dict(l=100, r=100, t=100, b=50)
+    Returns:
+        str: Path to the generated HTML file
+    """
+    return _create_hl_histogram(
+        _column_values(balanced_low_df, 'fan_speed_mean'),
+        _column_values(balanced_high_df, 'fan_speed_mean'),
+        FAN_HL_SPEC,
+        output_dir
     )
+
+
+def create_ttemp_hl_histogram(balanced_low_df, balanced_high_df, output_dir='outputs'):
+    """
+    Create side-by-side histograms comparing interface temperature distributions.
+    
+    Creates an interactive HTML visualization with separate histograms for low and
+    high speed fans' interface temperatures, including statistics.
     
-    # Update x and y axes labels
-    fig.update_xaxes(title_text='Interface Temperature (°C)', row=1, col=1)
-    fig.update_xaxes(title_text='Interface Temperature (°C)', row=1, col=2)
-    fig.update_yaxes(title_text='Frequency', row=1, col=1)
-    fig.update_yaxes(title_text='Frequency', row=1, col=2)
+    Args:
+        balanced_low_df (pd.DataFrame): Balanced dataframe with low speed fans
+        balanced_high_df (pd.DataFrame): Balanced dataframe with high speed fans
+        output_dir (str): Directory where the HTML file will be saved
     
-    # Set x-axis range to 50-130°C for both histograms with 10-degree tick marks
-    fig.update_xaxes(range=[50, 130], dtick=10, row=1, col=1)
-    fig.update_xaxes(range=[50, 130], dtick=10, row=1, col=2)
+    Returns:
+        str: Path to the generated HTML file
+    """
+    return _create_hl_histogram(
+        _column_values(balanced_low_df, 'Interface_Temp'),
+        _column_values(balanced_high_df, 'Interface_Temp'),
+        TTEMP_HL_SPEC,
+        output_dir
+    )
+
+
+def create_combined_hl_report(balanced_low_df, balanced_high_df, output_dir='outputs'):
+    """
+    Create one report with the fan speed and interface temperature comparisons.
     
-    # Save HTML file
-    html_file = output_path / 'ttemp_hl_histogram.html'
-    fig.write_html(str(html_file))
+    Combines the figures of create_fan_hl_histogram (top row) and
+    create_ttemp_hl_histogram (bottom row) in a single 2x2 figure, so the page
+    loads Plotly.js and lays out the figure once instead of twice.
     
-    return str(html_file)
+    Args:
+        balanced_low_df (pd.DataFrame): Balanced dataframe with low speed fans
+        balanced_high_df (pd.DataFrame): Balanced dataframe with high speed fans
+        output_dir (str): Directory where the HTML file will be saved
+        
+    Returns:
+        str: Path to the generated HTML file
+    """
+    rows = [
+        (_column_values(balanced_low_df, column), _column_values(balanced_high_df, column), spec)
+        for column, spec in (('fan_speed_mean', FAN_HL_SPEC), ('Interface_Temp', TTEMP_HL_SPEC))
+    ]
+    return _write_hl_figure(
+        rows,
+        'Fan Speed and Interface Temperature Distribution Comparison: Low vs High Speed Fans',
+        'hl_report.html',
+        output_dir
+    )